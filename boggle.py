@@ -3,12 +3,13 @@ FILE: boggle.py
 DESCRIPTION: runs the 'Boggle' game
 """
 # region import
-from typing import Tuple, Callable
+from functools import partial
+from typing import Tuple
 from tkinter import NORMAL
 
 import utils
 from model import Model
-from gui import GUI
+from gui import GUI, BOARD_SIZE, BOARD_COORDINATES
 
 # endregion import
 # region CONSTANTS
@@ -21,58 +22,28 @@ class Controller:
     """
     The controller of the 'Boggle' game
     """
+    __slots__ = ('model', 'gui', '__words_collection', '__commands_bound',
+                 '__refresh_pending')
 
     def __init__(self) -> None:
         # init vars
         self.model = Model()
         self.gui = GUI()
         self.__words_collection = utils.load_words_dict(WORDS_FILEPATH)
+        self.__commands_bound: bool = False  # board buttons' commands
+        self.__refresh_pending: bool = False  # board's display update
 
         # additional actions
         self.model.words_collection = self.__words_collection
         self.gui.button_play.config(command=self.on_play_button_pressed)
-
-    def create_board_button_callback(self, coordinate: Tuple[int, int]) -> \
-            Callable:
-        """
-        Creates a callback function for the board's buttons
-
-        :param coordinate: the coordinate of the button
-        :return: the callback function
-        """
-
-        def board_button_callback() -> None:
-            """
-            The callback function for the board's buttons
-            """
-            self.model.update_word_and_path(coordinate)
-
-            if self.model.current_path:
-                buttons_to_enable = self.model.get_buttons_to_enable()
-                self.gui.update_board_buttons_state(buttons_to_enable)
-            else:
-                self.gui.set_all_board_buttons_state(NORMAL)
-
-            self.gui.update_current_word(self.model.current_word)
-
-        return board_button_callback
-
-    def initialize_button_actions(self) -> None:
-        """
-        Initializes the button actions
-        """
-        self.gui.button_play.config(command=self.on_play_button_pressed)
         self.gui.button_restart.config(command=self.on_restart_button_pressed)
         self.gui.button_check.config(command=self.on_check_button_pressed)
-        self.set_board_buttons_command()
 
     def initialize_model(self) -> None:
         """
-        Initializes the model
+        Initializes the model for a new game
         """
-        self.model = Model()
-        self.model.words_collection = self.__words_collection
-        self.model.create_board()
+        self.model.reset()
 
     def on_play_button_pressed(self) -> None:
         """
@@ -81,7 +52,7 @@ class Controller:
         self.initialize_model()
         self.gui.show_board(self.model.board)
         self.gui.button_play_on_press()
-        self.initialize_button_actions()
+        self.set_board_buttons_command()
 
     def on_restart_button_pressed(self) -> None:
         """
@@ -90,28 +61,67 @@ class Controller:
         self.initialize_model()
         self.gui.button_restart_on_press()
         self.gui.show_board(self.model.board)
-        self.initialize_button_actions()
+        self.set_board_buttons_command()
+
+    def on_board_button_pressed(self, coordinate: Tuple[int, int]) -> None:
+        """
+        The callback function for the board's buttons
+
+        :param coordinate: the coordinate of the pressed button
+        """
+        # the buttons' states may not reflect the previous press yet, so
+        # presses that are not legal moves are ignored
+        row, col = coordinate
+        if self.model.current_path and row * BOARD_SIZE + col not in \
+                self.model.get_buttons_to_enable():
+            return
+
+        self.model.update_word_and_path(coordinate)
+
+        # presses that arrive before Tk is idle share a single display update
+        if not self.__refresh_pending:
+            self.__refresh_pending = True
+            self.gui.after_idle(self.__refresh_board)
+
+    def __refresh_board(self) -> None:
+        """
+        Updates the board's buttons and the current word according to the
+        model's current input
+        """
+        self.__refresh_pending = False
+
+        if self.model.current_path:
+            buttons_to_enable = self.model.get_buttons_to_enable()
+            self.gui.update_board_buttons_state(buttons_to_enable)
+        else:
+            self.gui.set_all_board_buttons_state(NORMAL)
+
+        self.gui.update_current_word(self.model.current_word)
 
     def on_check_button_pressed(self) -> None:
         """
         The callback function for the 'check' button
         """
-        response = self.model.check_word()
+        result = self.model.check_word()
         self.gui.update_current_word('')
-        self.gui.button_check_on_press(response)
+        self.gui.button_check_on_press(result.message)
         self.gui.update_score(self.model.score)
-        if response.startswith("You found"):
+        if result.ok:
             self.gui.add_word_to_words_found(self.model.current_word)
         self.model.reset_current_input()
 
     def set_board_buttons_command(self) -> None:
         """
-        Sets the callback functions for the board's buttons
+        Sets the callback functions for the board's buttons. The buttons are
+        never recreated, so this is done only once, when the first game starts
         """
-        for i in range(len(self.model.board)):
-            for j in range(len(self.model.board[0])):
-                callback_cmd = self.create_board_button_callback((i, j))
-                self.gui.set_board_buttons_command((i, j), callback_cmd)
+        if self.__commands_bound:
+            return
+
+        for coordinate in BOARD_COORDINATES:
+            callback_cmd = partial(self.on_board_button_pressed, coordinate)
+            self.gui.set_board_buttons_command(coordinate, callback_cmd)
+        self.__commands_bound = True
 
 
 if __name__ == "__main__":
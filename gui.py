@@ -4,18 +4,20 @@ DESCRIPTION: Represents the 'Boggle' game's GUI. There is no game logic
 associated with it, only visual design elements
 """
 # region import
-from typing import List, Dict, Tuple, Callable, Literal
-from idlelib.tooltip import Hovertip
+from typing import List, Dict, Set, Tuple, Callable, Literal
 from datetime import timedelta
 import tkinter as tki
-import tkinter.messagebox
 
+# 'idlelib.tooltip' and 'tkinter.messagebox' are imported where they are
+# used. the tooltips are only created once the main loop is idle, so
+# neither import runs while the window is being built
 # endregion import
 
 # region GAME SETTINGS
 BOARD_SIZE: int = 4
 TIMER_DURATION: int = 180  # default duration of the timer, in seconds
 TIMER_DELAY_IN_MS: int = 1000  # default delay in milliseconds
+TOOLTIP_DELAY_IN_MS: int = 200  # hover delay before showing a tooltip
 BOARD_BUTTON_TEXT: str = "❓"  # default text of a button on the board
 FONT: str = 'Segoe UI'
 # endregion GAME SETTINGS
@@ -34,6 +36,14 @@ ACTION_BUTTON_ACTIVE_BG_COLOR: str = "#86C8BC"
 
 # endregion COLORS
 # region CONSTANTS
+# the board's coordinates, row by row: (i, j) is at i * BOARD_SIZE + j
+BOARD_COORDINATES: Tuple[Tuple[int, int], ...] = tuple(
+    (i, j) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)
+)
+# the timer's text for every second left, e.g. TIMER_STRINGS[90] == "0:01:30"
+TIMER_STRINGS: Tuple[str, ...] = tuple(
+    str(timedelta(seconds=seconds)) for seconds in range(TIMER_DURATION + 1)
+)
 FONT_TYPES: Dict = {
     "button": (FONT, 20, 'bold'),
     "board_button": (FONT, 16, 'bold'),
@@ -41,22 +51,26 @@ FONT_TYPES: Dict = {
     "info": (FONT, 20),
     "listbox": (FONT, 14)
 }
+# button styles, keyed by Tk's option database names. each style is
+# registered once for all the buttons of its frame (see '_init_styles')
 BOARD_BUTTON_STYLE: Dict = {
     "font": FONT_TYPES['board_button'],
     "text": BOARD_BUTTON_TEXT,
     "foreground": BUTTON_FG_COLOR,
     "background": BOARD_BUTTON_BG_COLOR,
-    "activeforeground": BOARD_BUTTON_ACTIVE_FG_COLOR,
-    "activebackground": BOARD_BUTTON_ACTIVE_BG_COLOR,
-    "padx": 5,
-    "pady": 5
+    "activeForeground": BOARD_BUTTON_ACTIVE_FG_COLOR,
+    "activeBackground": BOARD_BUTTON_ACTIVE_BG_COLOR,
+    "padX": 5,
+    "padY": 5,
+    "width": 5,
+    "height": 2
 }
 ACTION_BUTTON_STYLE: Dict = {
     "font": FONT_TYPES['button'],
     "foreground": BUTTON_FG_COLOR,
     "background": ACTION_BUTTON_BG_COLOR,
-    "activeforeground": ACTION_BUTTON_ACTIVE_FG_COLOR,
-    "activebackground": ACTION_BUTTON_ACTIVE_BG_COLOR
+    "activeForeground": ACTION_BUTTON_ACTIVE_FG_COLOR,
+    "activeBackground": ACTION_BUTTON_ACTIVE_BG_COLOR
 }
 
 MESSAGES = {
@@ -113,9 +127,23 @@ class GUI:
         self._root.wm_iconphoto(False, icon)
 
         # creates the game window
+        self._init_styles()
         self._frame_game_init()
         self._frame_info_init()
 
+        # tooltips are only needed on hover, so they wait for the main loop
+        self._root.after_idle(self._tooltips_init)
+
+    def _init_styles(self) -> None:
+        """
+        Registers the buttons' styles in Tk's option database, so that every
+        button created in the board or the actions frame shares them
+        """
+        for option, value in BOARD_BUTTON_STYLE.items():
+            self._root.option_add(f'*board.Button.{option}', value)
+        for option, value in ACTION_BUTTON_STYLE.items():
+            self._root.option_add(f'*actions.Button.{option}', value)
+
     # region game frame
     def _frame_game_init(self) -> None:
         """
@@ -134,11 +162,10 @@ class GUI:
         """
         Creates and displays the timer
         """
-        td = str(timedelta(seconds=TIMER_DURATION))
         self._label_timer = tki.Label(
             self._frame_game,
             font=FONT_TYPES['info'],
-            text=td
+            text=TIMER_STRINGS[TIMER_DURATION]
         )
         self._label_timer.pack(side=tki.TOP)
 
@@ -148,23 +175,28 @@ class GUI:
         """
         self._frame_board = tki.Frame(
             self._frame_game,
+            name='board',
             bg=BOARD_FRAME_BG_COLOR
         )
         self._frame_board.pack(expand=True)
 
-        self._buttons_board = dict()
-        for i in range(BOARD_SIZE):
-            for j in range(BOARD_SIZE):
-                self._buttons_board[(i, j)] = tki.Button(
-                    self._frame_board,
-                    width=5,
-                    height=2,
-                    **BOARD_BUTTON_STYLE
-                )
-                self._buttons_board[(i, j)].grid(
-                    row=i, column=j,
-                    padx=10, pady=10
-                )
+        buttons = []
+        for i, j in BOARD_COORDINATES:
+            button = tki.Button(self._frame_board)
+            button.grid(
+                row=i, column=j,
+                padx=10, pady=10
+            )
+            buttons.append(button)
+        # buttons are stored in the order of BOARD_COORDINATES
+        self._buttons_board: Tuple[tki.Button, ...] = tuple(buttons)
+
+        # the (text, foreground) currently displayed by each board button
+        self._board_buttons_text: List[Tuple[str, str]] = \
+            [(BOARD_BUTTON_TEXT, BUTTON_FG_COLOR)] * len(self._buttons_board)
+        # indices of the board buttons currently in the 'normal' state
+        self._enabled_board_buttons: Set[int] = \
+            set(range(len(self._buttons_board)))
 
     def _frame_board_word_input_init(self) -> None:
         """
@@ -181,10 +213,11 @@ class GUI:
         """
         Creates and displays the 4x4 board cells
         """
-        self._frame_board_actions = tki.Frame(self._frame_game)
+        self._frame_board_actions = tki.Frame(self._frame_game, name='actions')
         self._frame_board_actions.pack(expand=True)
 
         self._button_play_init()
+        self._button_board_actions_init()
 
     def _button_play_init(self) -> None:
         """
@@ -193,53 +226,65 @@ class GUI:
         self._button_play = tki.Button(
             self._frame_board_actions,
             text='▶',
-            width=25,
-            **ACTION_BUTTON_STYLE
-        )
-        self._tooltip_play = Hovertip(
-            self._button_play, "Start game", hover_delay=200
+            width=25
         )
         self._button_play.grid(column=0, row=0, padx=20)
 
     def _button_board_actions_init(self) -> None:
         """
-        Creates the board's action buttons
+        Creates the board's action buttons. They are displayed only while
+        a game is running
         """
         # stop button
         self._button_stop = tki.Button(
             self._frame_board_actions,
             width=6,
             text='■',
-            command=self.button_stop_on_press,
-            **ACTION_BUTTON_STYLE
-        )
-        self._tooltip_stop = Hovertip(
-            self._button_stop, "Stop game", hover_delay=200
+            command=self.button_stop_on_press
         )
 
         # restart button
         self._button_restart = tki.Button(
             self._frame_board_actions,
             width=6,
-            text='↻',
-            **ACTION_BUTTON_STYLE
-        )
-        self._tooltip_restart = Hovertip(
-            self._button_restart, "Restart game", hover_delay=200
+            text='↻'
         )
 
         # check button
         self._button_check = tki.Button(
             self._frame_board_actions,
             width=6,
-            text='✓',
-            **ACTION_BUTTON_STYLE
+            text='✓'
+        )
+
+    def _tooltips_init(self) -> None:
+        """
+        Attaches the tooltips to the play button and the board's action
+        buttons
+        """
+        self._tooltip_play = self.__create_tooltip(
+            self._button_play, "Start game"
+        )
+        self._tooltip_stop = self.__create_tooltip(
+            self._button_stop, "Stop game"
         )
-        self._tooltip_check = Hovertip(
-            self._button_check, "Check word", hover_delay=200
+        self._tooltip_restart = self.__create_tooltip(
+            self._button_restart, "Restart game"
+        )
+        self._tooltip_check = self.__create_tooltip(
+            self._button_check, "Check word"
         )
 
-        self.__show_game_actions_buttons()
+    def __create_tooltip(self, widget: tki.Widget, text: str) -> object:
+        """
+        Attaches a tooltip to a widget, shown when hovering over it
+        :param widget: the widget to attach the tooltip to
+        :param text: the tooltip's text
+        :return: the tooltip
+        """
+        from idlelib.tooltip import Hovertip
+
+        return Hovertip(widget, text, hover_delay=TOOLTIP_DELAY_IN_MS)
 
     # endregion game frame
     # region info frame
@@ -373,9 +418,9 @@ class GUI:
     # endregion INIT GAME WINDOW
     # region GET & SET
     @property
-    def buttons_board(self) -> Dict[Tuple[int, int], tki.Button]:
+    def buttons_board(self) -> Tuple[tki.Button, ...]:
         """
-        Returns the board's buttons
+        Returns the board's buttons, row by row
         """
         return self._buttons_board
 
@@ -445,7 +490,7 @@ class GUI:
         :param time: the starting time
         """
         self.__time_left = time
-        self._label_timer['text'] = str(timedelta(seconds=time))
+        self._label_timer.config(text=TIMER_STRINGS[time])
 
         if time == 0:
             # end game
@@ -477,56 +522,89 @@ class GUI:
     # endregion timer
     # region board buttons
 
-    def show_board(self, board) -> None:
+    def show_board(self, board: Tuple[str, ...]) -> None:
         """
         Generates & updates the board cells' values
+
+        :param board: the board's values, row by row
         """
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                self._buttons_board[(row, col)].config(
-                    text=board[row][col], foreground=BUTTON_FG_COLOR)
+        for index, value in enumerate(board):
+            self.__set_board_button_text(index, value, BUTTON_FG_COLOR)
 
     def hide_board(self) -> None:
         """
         Hides the board cells' values
         """
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                self._buttons_board[(row, col)].config(
-                    text=BOARD_BUTTON_TEXT,
-                    foreground=TEXT_FG_COLOR
-                )
+        for index in range(len(self._buttons_board)):
+            self.__set_board_button_text(
+                index, BOARD_BUTTON_TEXT, TEXT_FG_COLOR)
+
+    def __set_board_button_text(self, index: int, text: str,
+                                foreground: str) -> None:
+        """
+        Sets the text of a board button, skipping the call to Tk when the
+        button already displays it
+
+        :param index: the index of the button
+        :param text: the text to display
+        :param foreground: the color of the text
+        """
+        if self._board_buttons_text[index] == (text, foreground):
+            return
+
+        self._buttons_board[index].config(text=text, foreground=foreground)
+        self._board_buttons_text[index] = (text, foreground)
 
     def set_board_buttons_command(self, coordinate: Tuple[int, int],
                                   command: Callable[[], None]) -> None:
         """
         Sets the command for the board buttons
         """
-        self._buttons_board[coordinate].config(command=command)
+        row, col = coordinate
+        self._buttons_board[row * BOARD_SIZE + col].config(command=command)
 
     def set_all_board_buttons_state(
             self, state: Literal["disabled", "normal"]) -> None:
         """
         Sets the state to all board buttons
         """
-        for button in self._buttons_board.values():
-            button.config(state=state)
+        if state == tki.NORMAL:
+            self.__set_enabled_board_buttons(
+                set(range(len(self._buttons_board))))
+        else:
+            self.__set_enabled_board_buttons(set())
 
-    def update_board_buttons_state(
-            self, buttons_to_enable: List[Tuple[int, int]]) -> None:
+    def update_board_buttons_state(self, buttons_to_enable: List[int]) -> None:
         """
-        Updates the state of specific board buttons
+        Updates the state of specific board buttons, disabling all the others
+
+        :param buttons_to_enable: the indices of the buttons to enable, where
+                                  (row, col) is at row * BOARD_SIZE + col
         """
-        self.set_all_board_buttons_state(tki.DISABLED)
-        self.enable_given_board_buttons(buttons_to_enable)
+        self.__set_enabled_board_buttons(set(buttons_to_enable))
 
-    def enable_given_board_buttons(
-            self, buttons_to_enable: List[Tuple[int, int]]) -> None:
+    def enable_given_board_buttons(self, buttons_to_enable: List[int]) -> None:
         """
         Enables specific board buttons
+
+        :param buttons_to_enable: the indices of the buttons to enable
+        """
+        self.__set_enabled_board_buttons(
+            self._enabled_board_buttons | set(buttons_to_enable))
+
+    def __set_enabled_board_buttons(self, buttons_to_enable: Set[int]) -> None:
         """
-        for coordinate in buttons_to_enable:
-            self._buttons_board[coordinate].config(state=tki.NORMAL)
+        Enables exactly the given board buttons. Only the buttons whose state
+        actually changes are reconfigured
+
+        :param buttons_to_enable: the indices of the buttons to enable
+        """
+        for index in self._enabled_board_buttons - buttons_to_enable:
+            self._buttons_board[index].config(state=tki.DISABLED)
+        for index in buttons_to_enable - self._enabled_board_buttons:
+            self._buttons_board[index].config(state=tki.NORMAL)
+
+        self._enabled_board_buttons = buttons_to_enable
 
     # endregion board buttons
     # region game action buttons
@@ -538,10 +616,10 @@ class GUI:
 
         self.update_current_word()
 
-        self._button_play['state'] = tki.DISABLED
+        self._button_play.config(state=tki.DISABLED)
         self._button_play.grid_forget()
 
-        self._button_board_actions_init()
+        self.__show_game_actions_buttons()
         self.set_all_board_buttons_state(tki.NORMAL)
 
         self.__countdown(TIMER_DURATION)
@@ -554,7 +632,8 @@ class GUI:
         self.__is_game_running = False
 
         # popup messagebox
-        msg_box = tki.messagebox.askquestion(
+        from tkinter import messagebox
+        msg_box = messagebox.askquestion(
             "Stop game",
             "Are you sure you want to stop the current game?",
             icon="warning"
@@ -573,19 +652,33 @@ class GUI:
         """
         Restarts the game
         """
-        self._init_vars()
-        self._frame_game.destroy()
-        self._frame_game_init()
-        self._frame_info.destroy()
-        self._frame_info_init()
         self.__stop_countdown()
+        self.__clear_word_input_job()
+        self._init_vars()
+        self._reset_widgets()
         self.button_play_on_press()
 
+    def _reset_widgets(self) -> None:
+        """
+        Resets the existing widgets to their initial state, without
+        recreating them. The board buttons' text is left as is, since the
+        new board is shown right after, and only its changed cells are
+        updated
+        """
+        # game frame
+        self._label_timer.config(text=TIMER_STRINGS[TIMER_DURATION])
+        self._label_word_input.config(text="")
+
+        # info frame
+        self.update_score(score=self.__score)
+        self.update_current_word(content=self.__current_word)
+        self._label_words_found.delete(0, tki.END)
+
     def button_check_on_press(self, response: str) -> None:
         """
         Validates the generated word by the player
         """
-        self._label_word_input['text'] = response
+        self._label_word_input.config(text=response)
         self.set_all_board_buttons_state(tki.NORMAL)
         self.__clear_word_input_job()
         self.__word_input_label_job = self._root.after(
@@ -610,12 +703,12 @@ class GUI:
 
     # endregion game action buttons
     # region check word input
-    def add_word_to_words_found(self, word) -> None:
+    def add_word_to_words_found(self, *words: str) -> None:
         """
-        Appends a word to the 'words found' listbox
-        :param word: the word to be added
+        Appends words to the 'words found' listbox, in a single insertion
+        :param words: the words to be added
         """
-        self._label_words_found.insert(tki.END, word)
+        self._label_words_found.insert(tki.END, *words)
 
     def update_current_word(
             self, content="", fg_color=LIGHT_TEXT_FG_COLOR) -> None:
@@ -639,7 +732,7 @@ class GUI:
         Deletes the text on the label which indicates the validity of the
         input word given
         """
-        self._label_word_input['text'] = ""
+        self._label_word_input.config(text="")
 
     # endregion check word input
 
@@ -648,6 +741,8 @@ class GUI:
         Prompts the player with an end-game message according to the
         board's state
         """
+        from tkinter import messagebox
+
         if self.__is_game_running:
             # stops the game
             self.__is_game_running = False
@@ -656,13 +751,13 @@ class GUI:
             game_over_msg = MESSAGES['STOP_GAME'].format(
                 self._label_words_found.size(), self.__score
             )
-            tki.messagebox.showinfo("Stay a little longer?", game_over_msg)
+            messagebox.showinfo("Stay a little longer?", game_over_msg)
         else:
             # game over messagebox
             game_over_msg = MESSAGES['GAME_OVER'].format(
                 self._label_words_found.size(), self.__score
             )
-            tki.messagebox.showinfo("Time's up!", game_over_msg)
+            messagebox.showinfo("Time's up!", game_over_msg)
 
     def __end_game(self) -> None:
         # shows appropriate message
@@ -676,17 +771,24 @@ class GUI:
 
         # timer
         self.__stop_countdown()
-        self._label_timer['text'] = str(timedelta(seconds=TIMER_DURATION))
+        self._label_timer.config(text=TIMER_STRINGS[TIMER_DURATION])
 
         # action button
         self.__hide_game_action_buttons()
-        self._button_play['state'] = tki.NORMAL
+        self._button_play.config(state=tki.NORMAL)
         self._button_play.grid(column=0, row=0, padx=20)
 
         # hide board buttons
         self.set_all_board_buttons_state(tki.DISABLED)
         self.hide_board()
 
+    def after_idle(self, callback: Callable[[], None]) -> None:
+        """
+        Schedules a callback to run once Tk has processed all pending events
+        :param callback: the function to call
+        """
+        self._root.after_idle(callback)
+
     def run(self) -> None:
         """
         Starts the mainloop
@@ -3,14 +3,29 @@ FILE: model.py
 DESCRIPTION: Represents the logic behind the 'Boggle' game
 """
 # region import
-import math
-from typing import List, Set, Tuple
+from typing import List, Set, FrozenSet, Tuple, NamedTuple
 
 import utils
 import boggle_board_randomizer as bb_randomizer
 
 
 # endregion import
+# region CONSTANTS
+BOARD_SIZE: int = bb_randomizer.BOARD_SIZE
+BOARD_ADJACENCY: Tuple[Tuple[int, ...], ...] = \
+    utils.build_adjacency(BOARD_SIZE, BOARD_SIZE)
+
+
+# endregion CONSTANTS
+
+
+class CheckResult(NamedTuple):
+    """
+    The result of checking the current word: whether it was accepted, and the
+    message to show the player
+    """
+    ok: bool
+    message: str
 
 
 class Model:
@@ -19,18 +34,24 @@ class Model:
     """
 
     def __init__(self) -> None:
-        self.__board: List[List[str]] = [[]]
-        self.__words_collection: Set[str] = set()
+        # the board's values row by row: (row, col) is at
+        # row * BOARD_SIZE + col
+        self.__board: Tuple[str, ...] = ()
+        self.__words_collection: FrozenSet[str] = frozenset()
         self.__words_found: Set[str] = set()
         self.__current_word: str = ""
         self.__current_path: utils.Path = []
+        self.__path_cells: Set[int] = set()  # the current path's indices
+        # the length of each value added to the current word, in order
+        self.__segment_lens: List[int] = []
+        self.__buttons_to_enable: List[int] = []
         self.__score: int = 0
 
     # region GET & SET
     @property
-    def board(self) -> List[List[str]]:
+    def board(self) -> Tuple[str, ...]:
         """
-        Returns the current board's values in a 2 dimensional matrix
+        Returns the current board's values, row by row
         """
         return self.__board
 
@@ -61,22 +82,23 @@ class Model:
         Increases the score by the square of the path length
         :return: the new score
         """
-        self.__score += int(math.pow(len(self.__current_path), 2))
+        path_length = len(self.__current_path)
+        self.__score += path_length * path_length
         return self.__score
 
     # endregion property: score
     # region property: words_collection
     @property
-    def words_collection(self) -> Set[str]:
+    def words_collection(self) -> FrozenSet[str]:
         """
         Returns the current words collection
         """
         return self.__words_collection
 
     @words_collection.setter
-    def words_collection(self, words_collection: Set[str]) -> None:
+    def words_collection(self, words_collection: FrozenSet[str]) -> None:
         """
-        Sets the words collection
+        Sets the words collection. The collection is shared, not copied
 
         :param words_collection: the new words collection
         """
@@ -88,9 +110,22 @@ class Model:
 
     def create_board(self) -> None:
         """
-        Creates a new board: 2 dimentional matrix with letter values
+        Creates a new board, flattening the randomized letter values row by
+        row
         """
-        self.__board = bb_randomizer.randomize_board()
+        self.__board = tuple(
+            letter for row in bb_randomizer.randomize_board() for letter in row
+        )
+
+    def reset(self) -> None:
+        """
+        Resets the game's state in place and creates a new board. The words
+        collection is kept
+        """
+        self.__words_found.clear()
+        self.reset_current_input()
+        self.__score = 0
+        self.create_board()
 
     def update_word_and_path(self, board_coordinate: Tuple[int, int]) -> None:
         """
@@ -99,32 +134,43 @@ class Model:
         :param board_coordinate: the pressed coordinate on the board
         """
         y, x = board_coordinate
+        cell = y * BOARD_SIZE + x
 
         # checks whether the last button pressed is the same as now
         if self.__current_path and self.__current_path[-1] == board_coordinate:
             # undo
-            self.__current_path.remove(board_coordinate)
-            slice_index = len(self.__current_word) - len(self.__board[y][x])
-            self.__current_word = self.__current_word[:slice_index]
+            self.__current_path.pop()
+            self.__path_cells.remove(cell)
+            segment_len = self.__segment_lens.pop()
+            self.__current_word = self.__current_word[:-segment_len]
         else:
             # add
-            self.__current_word += self.__board[y][x]
+            value = self.__board[cell]
+            self.__current_word += value
+            self.__segment_lens.append(len(value))
             self.__current_path.append(board_coordinate)
+            self.__path_cells.add(cell)
+
+        self.__update_buttons_to_enable()
 
-    def check_word(self) -> str:
+    def check_word(self) -> CheckResult:
         """
         Reacts to the given word input with an appropriate message to the
         situation
+
+        :return: whether the word was accepted, and the message to show
         """
 
         # verifications
         existing_word = self.__current_word not in self.__words_collection
         if existing_word:
-            return f"'{self.__current_word}' is not a word"
+            return CheckResult(
+                False, f"'{self.__current_word}' is not a word")
 
         word_found = self.__current_word in self.__words_found
         if word_found:
-            return f"You already found '{self.__current_word}'"
+            return CheckResult(
+                False, f"You already found '{self.__current_word}'")
 
         # passed verifications
         self.__words_found.add(self.__current_word)
@@ -132,9 +178,10 @@ class Model:
 
         # show message based on word length
         if len(self.__current_word) < 6:
-            return f"You found '{self.__current_word}'"
+            return CheckResult(True, f"You found '{self.__current_word}'")
         else:
-            return f"You found '{self.__current_word}'. Nice work!"
+            return CheckResult(
+                True, f"You found '{self.__current_word}'. Nice work!")
 
     def reset_current_input(self) -> None:
         """
@@ -142,37 +189,35 @@ class Model:
         """
         self.__current_word = ""
         self.__current_path = []
+        self.__path_cells = set()
+        self.__segment_lens = []
+        self.__buttons_to_enable = []
 
-    def get_buttons_to_enable(self) -> List[Tuple[int, int]]:
+    def get_buttons_to_enable(self) -> List[int]:
         """
         Returns a list of buttons to enable, including the last button
-        pressed, and all of its neighbors that haven't been selected yet
+        pressed, and all of its neighbors that haven't been selected yet.
+        Each button is given by its index on the board, where (row, col) is
+        at row * BOARD_SIZE + col
         """
-        base_row, base_col = self.__current_path[-1]
-        button_coordinates_list = [(base_row, base_col)]
-
-        # iterates through neighbours
-        for delta_row, delta_col in utils.NEIGHBOURS_DELTA.values():
-            neighbour_coordinate = (base_row + delta_row, base_col + delta_col)
-
-            inbounds = self.__is_coordinate_in_boundaries(neighbour_coordinate)
-            not_chosen = neighbour_coordinate not in self.__current_path
-            if inbounds and not_chosen:
-                button_coordinates_list.append(neighbour_coordinate)
-
-        return button_coordinates_list
+        return self.__buttons_to_enable
 
-    def __is_coordinate_in_boundaries(self, coordinate: Tuple[int, int]) -> \
-            bool:
+    def __update_buttons_to_enable(self) -> None:
         """
-        Checks if the given coordinate is within the board's boundaries
-
-        :param coordinate: the coordinate to check
-        :return: True if the coordinate is within the board's boundaries,
-                 False otherwise
+        Recomputes the buttons to enable after the current path has changed,
+        from the neighbours of the path's last cell
         """
-        return 0 <= coordinate[0] < len(self.__board) and \
-               0 <= coordinate[1] < len(self.__board[0])
+        if not self.__current_path:
+            self.__buttons_to_enable = []
+            return
+
+        base_row, base_col = self.__current_path[-1]
+        base_cell = base_row * BOARD_SIZE + base_col
+
+        self.__buttons_to_enable = [base_cell] + [
+            neighbour_cell for neighbour_cell in BOARD_ADJACENCY[base_cell]
+            if neighbour_cell not in self.__path_cells
+        ]
 
 
 if __name__ == "__main__":
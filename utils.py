@@ -2,49 +2,69 @@
 FILE: utils.py
 DESCRIPTION: Utility functions that we were required to implement
 """
-from typing import List, Tuple, Iterable, Optional, Dict, Set, Callable, Union
+from functools import lru_cache
+from typing import List, Tuple, Iterable, Optional, Dict, FrozenSet, \
+    Callable, NamedTuple, Union
 
 Board = List[List[str]]
 Path = List[Tuple[int, int]]
+Cells = Tuple[int, ...]  # a path of flat cell indices
+Trie = Dict[str, Union[dict, bool, int]]
 
 # region CONSTANTS
-NEIGHBOURS_DELTA: Dict[str, Tuple[int, int]] = {
-    # "direction": (row_delta, col_delta)
-    "N": (-1, 0),
-    "NE": (-1, 1),
-    "E": (0, 1),
-    "SE": (1, 1),
-    "S": (1, 0),
-    "SW": (1, -1),
-    "W": (0, -1),
-    "NW": (-1, -1)
-}
+NEIGHBOURS_DELTA: Tuple[Tuple[int, int], ...] = (
+    # (row_delta, col_delta)
+    (-1, 0),  # N
+    (-1, 1),  # NE
+    (0, 1),  # E
+    (1, 1),  # SE
+    (1, 0),  # S
+    (1, -1),  # SW
+    (0, -1),  # W
+    (-1, -1)  # NW
+)
+# the key marking the end of a word in a trie's node. the trie is walked one
+# letter (a single character) at a time, so an empty key never collides
+WORD_END: str = ""
+# the key holding the length of the longest word suffix below a trie's node.
+# it is longer than a single character, so it never collides with a letter
+MAX_SUFFIX: str = "max_suffix"
 
 
 # endregion CONSTANTS
 
-def load_words_dict(filepath):
+def load_words_dict(filepath: str) -> FrozenSet[str]:
     """
     Loads a dictionary of words from a file
 
     :param filepath: The path of the file to load
-    :return: A set of words
+    :return: An immutable set of words
     """
     with open(filepath) as file:
-        return set(file.read().splitlines())
+        # reads line by line, without holding the whole file's text at once
+        return frozenset(map(str.rstrip, file))
 
 
-def __get_value_by_coordinate(board: Board, coordinate: Tuple[int, int]) -> \
-        str:
+@lru_cache(maxsize=None)
+def build_adjacency(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
     """
-    Returns the current value of the given coordinate
+    Builds the adjacency table of a board, where each cell is given by its
+    flat index: (row, col) is at row * cols + col
 
-    :param board: the board
-    :param coordinate: a coordinate on the board
-    :return: The value in board of the given coordinate
+    :param rows: the number of rows on the board
+    :param cols: the number of columns on the board
+    :return: for each cell, the indices of its neighbours within the board
     """
-    row, col = coordinate
-    return board[row][col]
+    adjacency: List[Tuple[int, ...]] = []
+    for row in range(rows):
+        for col in range(cols):
+            adjacency.append(tuple(
+                (row + row_delta) * cols + col + col_delta
+                for row_delta, col_delta in NEIGHBOURS_DELTA
+                if 0 <= row + row_delta < rows and 0 <= col + col_delta < cols
+            ))
+
+    return tuple(adjacency)
 
 
 def __are_neighbours(coordinate1: Tuple[int, int],
@@ -57,12 +77,10 @@ def __are_neighbours(coordinate1: Tuple[int, int],
     :return: True if both coordinates are neighbours, False otherwise
     """
     row1, col1 = coordinate1
+    row2, col2 = coordinate2
 
-    for row_delta, col_delta in NEIGHBOURS_DELTA.values():
-        if (row1 + row_delta, col1 + col_delta) == coordinate2:
-            return True
-
-    return False
+    return abs(row1 - row2) <= 1 and abs(col1 - col2) <= 1 and \
+        coordinate1 != coordinate2
 
 
 def is_valid_path(board: Board, path: Path, words: Iterable[str]) -> \
@@ -76,18 +94,12 @@ def is_valid_path(board: Board, path: Path, words: Iterable[str]) -> \
     :param words: the words collection
     :return: The word if it is valid, None otherwise
     """
-    word: str = ''
-
-    for path_index in range(len(path) - 1):
-        # check whether two following cells are actually neighbours on board
-        if not __are_neighbours(path[path_index], path[path_index + 1]):
+    # check whether every two following cells are actually neighbours
+    for coordinate, next_coordinate in zip(path, path[1:]):
+        if not __are_neighbours(coordinate, next_coordinate):
             return None
 
-        # add the current coordinate's value
-        word += __get_value_by_coordinate(board, path[path_index])
-
-    # add the last value
-    word += __get_value_by_coordinate(board, path[-1])
+    word = ''.join([board[row][col] for row, col in path])
 
     if word in words:
         return word
@@ -95,46 +107,6 @@ def is_valid_path(board: Board, path: Path, words: Iterable[str]) -> \
     return None
 
 
-def __is_coordinate_in_board(board: Board, coordinate: Tuple[int, int]) -> \
-        bool:
-    """
-    Checks if the given coordinate is within the board's boundaries
-
-    :param board: the board
-    :param coordinate: the coordinate to check
-    :return: True if the coordinate is within the board's boundaries,
-             False otherwise
-    """
-    return 0 <= coordinate[0] < len(board) and \
-           0 <= coordinate[1] < len(board[0])
-
-
-def __find_neighbour_coordinate(coordinate: Tuple[int, int],
-                                delta: Tuple[int, int]) -> Tuple[int, int]:
-    """
-    Computes the neighbour's coordinate by a given delta
-
-    :param coordinate: the starting coordinate
-    :param delta: the delta for the required neighbour
-    :return: the neighbour's coordinate
-    """
-    neighbour_row = coordinate[0] + delta[0]
-    neighbour_col = coordinate[1] + delta[1]
-    return neighbour_row, neighbour_col
-
-
-def __filter_words_set_by_prefix(words_set: Set[str], prefix: str) -> Set[str]:
-    """
-    Filters the words set, finding only the words starting with the
-    given prefix
-
-    :param words_set: the set to filter
-    :param prefix: the prefix to filter by
-    :return: a filtered set
-    """
-    return set(filter(lambda s: s.startswith(prefix), words_set))
-
-
 def find_length_n_paths(n: int, board: Board, words: Iterable[str]) -> \
         List[Path]:
     """
@@ -146,17 +118,21 @@ def find_length_n_paths(n: int, board: Board, words: Iterable[str]) -> \
     :return: a list containing all valid paths of length 'n'
     """
 
-    def stop(n: int, path: Path, word: str) -> bool:
-        return len(path) == n
+    def match(path_length: int, word_length: int) -> bool:
+        return path_length == n
+
+    def stop(path_length: int, word_length: int, max_suffix: int) -> bool:
+        # each further cell adds at least a letter to the word
+        return path_length >= n or path_length + max_suffix < n
 
-    def update(lst_paths: List[Path], path: Path, word: str) -> None:
-        lst_paths.append(path[:])
+    def update(cells: Cells, word: str) -> None:
+        lst_paths.append(cells)
 
-    lst_paths: List[Path] = []
+    lst_paths: List[Cells] = []
 
-    __backtracking_start(stop, update, n, board, words, lst_paths)
+    __backtracking_start(board, words, [__Emitter(match, stop, update)])
 
-    return lst_paths
+    return [__cells_to_path(cells, len(board[0])) for cells in lst_paths]
 
 
 def find_length_n_words(n: int, board: Board, words: Iterable[str]) -> \
@@ -171,17 +147,20 @@ def find_length_n_words(n: int, board: Board, words: Iterable[str]) -> \
              one path to a word
     """
 
-    def stop(n: int, path: Path, word: str) -> bool:
-        return len(word) == n
+    def match(path_length: int, word_length: int) -> bool:
+        return word_length == n
 
-    def update(lst_paths: List[Path], path: Path, word: str) -> None:
-        lst_paths.append(path[:])
+    def stop(path_length: int, word_length: int, max_suffix: int) -> bool:
+        return word_length >= n or word_length + max_suffix < n
 
-    lst_paths: List[Path] = []
+    def update(cells: Cells, word: str) -> None:
+        lst_paths.append(cells)
 
-    __backtracking_start(stop, update, n, board, words, lst_paths)
+    lst_paths: List[Cells] = []
 
-    return lst_paths
+    __backtracking_start(board, words, [__Emitter(match, stop, update)])
+
+    return [__cells_to_path(cells, len(board[0])) for cells in lst_paths]
 
 
 def max_score_paths(board: Board, words: Iterable[str]) -> List[Path]:
@@ -194,115 +173,239 @@ def max_score_paths(board: Board, words: Iterable[str]) -> List[Path]:
     :return: a list of valid routes that provide the maximum game score
     """
 
-    def stop(n: int, path: Path, word: str) -> bool:
-        return len(word) == n
+    def match(path_length: int, word_length: int) -> bool:
+        return True
 
-    def update(dict_paths: Dict[str, List[Path]], path: Path,
-               word: str) -> None:
-        if word not in dict_paths.keys():
-            dict_paths[word] = []
-        dict_paths[word].append(path[:])
+    def stop(path_length: int, word_length: int, max_suffix: int) -> bool:
+        return False
 
-    dict_paths: Dict[str, List[Path]] = {}
+    def update(cells: Cells, word: str) -> None:
+        # keep only the longest path found for each word
+        longest_cells = dict_paths.get(word)
+        if longest_cells is None or len(cells) > len(longest_cells):
+            dict_paths[word] = cells
 
-    # perform a similar function to find_length_n_words, for each
-    # word-length that can be found in the given words bank.
-    # this has the same effect as iterating over all words, but with
-    # fewer actions to perform.
-    word_lengths: Set[int] = set(map(lambda s: len(s), words))
-    for length in word_lengths:
-        __backtracking_start(stop, update, length, board, words, dict_paths)
+    dict_paths: Dict[str, Cells] = {}
 
-    # create a list of the longest paths found, by taking the longest
-    # path for each word found.
-    longest_paths: List[Path] = []
-    for lst_paths in dict_paths.values():
-        longest_paths.append(max(lst_paths, key=lambda p: len(p)))
+    # a single search records every word found on the way, whatever its
+    # length; the trie ends each branch once no word can be extended
+    __backtracking_start(board, words, [__Emitter(match, stop, update)])
 
-    return longest_paths
+    return [__cells_to_path(cells, len(board[0]))
+            for cells in dict_paths.values()]
 
 
-def __backtracking_start(stop_condition: Callable, data_update_func: Callable,
-                         n: int, board: Board, words: Iterable[str],
-                         dataset: Union[List[Path], Dict[str, List[Path]]]) -> \
-        None:
+class __Emitter(NamedTuple):
     """
-    Start the backtracking action for each coordinate
-
-    :param stop_condition: a boolean function that defines the recursion's
-    stop condition. Recieves the integer 'n', the current path and the
-    current word.
-    :param data_update_func: a function that updates the dataset, to be
-    called only when needed. This will update the dataset, so the function
-    returns nothing.
-    :param n: the length required
-    :param board: the board
+    Describes what a backtracking search collects. Several emitters can
+    share a single search over the board
+    """
+    # whether a word ending at the current path should be recorded.
+    # receives the current path's length and the current word's length
+    match_condition: Callable[[int, int], bool]
+    # whether no deeper path can match anymore. receives the same arguments,
+    # and the length of the longest word suffix that may still follow
+    stop_condition: Callable[[int, int, int], bool]
+    # records a matching path, given as flat cell indices, and its word
+    data_update_func: Callable[[Cells, str], None]
+
+
+def __cells_to_path(cells: Cells, cols: int) -> Path:
+    """
+    Translates a path of flat cell indices into a path of coordinates
+
+    :param cells: the path's cells, where (row, col) is at row * cols + col
+    :param cols: the number of columns on the board
+    :return: the path's coordinates
+    """
+    return [divmod(cell, cols) for cell in cells]
+
+
+@lru_cache(maxsize=1)
+def __build_trie(words: FrozenSet[str]) -> Trie:
+    """
+    Builds a prefix tree out of the words collection. Each node maps a letter
+    to its child node, and holds the WORD_END key if a word ends there.
+    Identical subtrees are then merged, turning the trie into a directed
+    acyclic word graph (DAWG) that accepts the same words with far fewer
+    nodes. Each node finally holds, under the MAX_SUFFIX key, the length of
+    the longest suffix leading from it to a word's end. The last trie built
+    is cached, so repeated searches with the same words collection build it
+    only once; it must not be modified
+
     :param words: the words collection
-    :param dataset: either a list of paths, or a dictionary mapping words
-    to lists of paths.
+    :return: the root of the trie
     """
-    # create a set out of the iterator, so it can be read more than once
-    words_set = set(words)
+    root: Trie = {}
+    for word in words:
+        node = root
+        for letter in word:
+            node = node.setdefault(letter, {})
+        node[WORD_END] = True
 
-    # pick the starting coordinate
-    for row_index in range(len(board)):
-        for col_index in range(len(board[row_index])):
+    root = __merge_trie_suffixes(root, {})
+    __set_max_suffix(root)
 
-            # initialize values for this starting coordinate
-            coordinate = (row_index, col_index)
-            curr_word = __get_value_by_coordinate(board, coordinate)
-            filtered_words = __filter_words_set_by_prefix(words_set, curr_word)
+    return root
 
-            # only proceed if words with this prefix can be found.
-            # otherwise, skip to the next coordinate.
-            if len(filtered_words) == 0:
-                continue
 
-            curr_path: Path = [coordinate]
+def __merge_trie_suffixes(node: Trie, registry: Dict[frozenset, Trie]) -> \
+        Trie:
+    """
+    Merges the identical subtrees of a trie, bottom-up. Two nodes are
+    identical if they hold the same keys, and their children were already
+    merged into the same nodes
+
+    :param node: the root of the subtree to merge
+    :param registry: the merged nodes found so far, by their signature
+    :return: the node to use in place of the given one
+    """
+    for key, child in node.items():
+        if key != WORD_END:
+            node[key] = __merge_trie_suffixes(child, registry)
 
-            # recursively find paths starting from this coordinate
-            __backtracking_action(stop_condition, data_update_func, n, board,
-                                  words_set, dataset, curr_path, curr_word)
+    signature = frozenset((key, id(child)) for key, child in node.items())
+    return registry.setdefault(signature, node)
 
 
-def __backtracking_action(stop_condition: Callable, data_update_func: Callable,
-                          n: int, board: Board, words_set: Set[str],
-                          dataset: Union[List[Path], Dict[str, List[Path]]],
-                          curr_path: Path, curr_word: str) -> None:
+def __set_max_suffix(node: Trie) -> int:
     """
-    Crawl the board. To be called from _backtracking_start.
+    Stores in each node of a trie the length of the longest suffix leading
+    from it to a word's end. Shared nodes are only visited once
+
+    :param node: the root of the subtree to annotate
+    :return: the length stored in the given node
     """
-    if stop_condition(n, curr_path, curr_word):
-        if curr_word in words_set:
-            data_update_func(dataset, curr_path, curr_word)
-        return
+    max_suffix = node.get(MAX_SUFFIX)
+    if max_suffix is not None:
+        return max_suffix
 
-    # try all neighbours
-    for delta in NEIGHBOURS_DELTA.values():
-        neighbour = __find_neighbour_coordinate(curr_path[-1], delta)
+    max_suffix = 0
+    for key, child in node.items():
+        if key != WORD_END:
+            max_suffix = max(max_suffix, __set_max_suffix(child) + 1)
+
+    node[MAX_SUFFIX] = max_suffix
+    return max_suffix
+
+
+def __walk_trie(node: Trie, value: str) -> Optional[Trie]:
+    """
+    Follows a board value down the trie, one letter at a time, so that
+    values made of several letters (e.g. 'QU') are supported
+
+    :param node: the node to start from
+    :param value: the value to follow
+    :return: the node reached, or None if no word continues with the value
+    """
+    for letter in value:
+        node = node.get(letter)
+        if node is None:
+            return None
+
+    return node
 
-        # try only if neighbour is within the board's boundaries
-        if not __is_coordinate_in_board(board, neighbour):
+
+def __backtracking_start(board: Board, words: Iterable[str],
+                         emitters: List[__Emitter]) -> None:
+    """
+    Start the backtracking action for each cell. The search goes on as long
+    as one of the emitters may still match deeper paths
+
+    :param board: the board
+    :param words: the words collection
+    :param emitters: the emitters to report the paths found to
+    """
+    # build the trie once, so each step checks its prefix in O(1). a frozenset
+    # is hashable, so it also keys the trie's cache
+    if not isinstance(words, frozenset):
+        words = frozenset(words)
+    trie = __build_trie(words)
+
+    # flatten the board, so each cell is a single index: (row, col) is at
+    # row * cols + col
+    cols = len(board[0])
+    values = tuple(value for row in board for value in row)
+    adjacency = build_adjacency(len(board), cols)
+
+    # pick the starting cell
+    for cell in range(len(values)):
+
+        # initialize values for this starting cell
+        trie_node = __walk_trie(trie, values[cell])
+
+        # only proceed if words with this prefix can be found.
+        # otherwise, skip to the next cell.
+        if trie_node is None:
             continue
 
+        curr_path: List[int] = [cell]
+
+        # recursively find paths starting from this cell
+        __backtracking_action(emitters, values, adjacency, trie_node,
+                              curr_path, 1 << cell, len(values[cell]))
+
+
+def __backtracking_action(emitters: List[__Emitter], values: Tuple[str, ...],
+                          adjacency: Tuple[Tuple[int, ...], ...],
+                          trie_node: Trie, curr_path: List[int],
+                          visited: int, word_length: int,
+                          _word_end: str = WORD_END,
+                          _max_suffix: str = MAX_SUFFIX) -> None:
+    """
+    Crawl the board. To be called from _backtracking_start. The path is
+    made of flat cell indices, and is copied into a tuple only when a path
+    is recorded. 'visited' is a bitmask of the path's cells, where bit i is
+    set if cell i is on the path. The current word itself is only known by
+    its trie node and length, and is built when a path is recorded.
+    The trie's keys are bound as default arguments, so they are read as
+    local variables, and are not meant to be passed.
+    """
+    path_length = len(curr_path)
+
+    if _word_end in trie_node:
+        cells, word = None, None
+        for emitter in emitters:
+            if emitter.match_condition(path_length, word_length):
+                if cells is None:
+                    cells = tuple(curr_path)
+                    word = ''.join([values[cell] for cell in curr_path])
+                emitter.data_update_func(cells, word)
+
+    # stop only once none of the emitters can match deeper paths
+    max_suffix = trie_node[_max_suffix]
+    for emitter in emitters:
+        if not emitter.stop_condition(path_length, word_length, max_suffix):
+            break
+    else:
+        return
+
+    # try all neighbours
+    for neighbour_cell in adjacency[curr_path[-1]]:
+
         # try only if the neighbour hasn't been stepped through yet
-        if neighbour in curr_path:
+        if visited >> neighbour_cell & 1:
             continue
 
-        # extend the word and filter the words set
-        new_word = curr_word + __get_value_by_coordinate(board, neighbour)
-        filtered_words = __filter_words_set_by_prefix(words_set, new_word)
+        # extend the word by advancing in the trie. as in __walk_trie, but
+        # inlined, since this runs for every neighbour
+        value = values[neighbour_cell]
+        child_node = trie_node
+        for letter in value:
+            child_node = child_node.get(letter)
+            if child_node is None:
+                break
 
-        if len(filtered_words) == 0:
+        if child_node is None:
             continue
 
         # extend the path
-        curr_path.append(neighbour)
+        curr_path.append(neighbour_cell)
 
         # recursive call with the path and word extended
-        __backtracking_action(stop_condition, data_update_func,
-                              n, board, filtered_words, dataset, curr_path,
-                              new_word)
+        __backtracking_action(emitters, values, adjacency, child_node,
+                              curr_path, visited | 1 << neighbour_cell,
+                              word_length + len(value))
 
         # clean up for backtracking
         curr_path.pop()